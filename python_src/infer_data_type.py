@@ -18,7 +18,7 @@ class FieldAnalysis:
     sample_values: List[str]
     unique_ratio: float
     null_ratio: float
-    validation_pattern: str
+    validation_pattern: Optional[str]
 
 
 class EnhancedSalesforceValidator:
@@ -54,6 +54,125 @@ class EnhancedSalesforceValidator:
 
     def analyze_field(self, field_name: str, data: pd.Series) -> FieldAnalysis:
         """Analyze a field and determine its likely Salesforce data type"""
+        prepared = self._prepare_field(field_name, data)
+        if isinstance(prepared, FieldAnalysis):
+            return prepared
+
+        non_null_values, unique_ratio, null_ratio = prepared
+        type_scores = self.score_fields([non_null_values])[0]
+        return self._build_analysis(
+            field_name, non_null_values, unique_ratio, null_ratio, type_scores
+        )
+
+    def analyze_fields(self, fields: Dict[str, pd.Series]) -> Dict[str, FieldAnalysis]:
+        """
+        Analyze several fields at once, scoring all of them in a single batched pass
+
+        Args:
+            fields: Mapping of field name to its column data
+
+        Returns:
+            Dictionary of FieldAnalysis results keyed by field name
+        """
+        results = {}
+        pending = []
+        for field_name, data in fields.items():
+            try:
+                prepared = self._prepare_field(field_name, data)
+            except Exception as e:
+                print(f"Error analyzing column {field_name}: {str(e)}")
+                results[field_name] = _default_analysis(field_name)
+                continue
+
+            if isinstance(prepared, FieldAnalysis):
+                results[field_name] = prepared
+            else:
+                results[field_name] = None  # Keep column order; filled in below
+                pending.append((field_name, *prepared))
+
+        score_matrix = self.score_fields([values for _, values, _, _ in pending])
+        for (field_name, values, unique_ratio, null_ratio), type_scores in zip(
+            pending, score_matrix
+        ):
+            results[field_name] = self._build_analysis(
+                field_name, values, unique_ratio, null_ratio, type_scores
+            )
+
+        return results
+
+    def score_fields(self, columns: List[pd.Series]) -> np.ndarray:
+        """
+        Score non-null string columns against every Salesforce type
+
+        All columns are stacked into one contiguous series so that each pattern
+        and parse check runs once, then reduced per column using the column
+        offsets into the stack.
+
+        Args:
+            columns: Non-empty series of cleaned, non-null string values
+
+        Returns:
+            A (columns x types) score matrix, in the order of ``self.patterns``.
+            Types that could not be scored for a column are NaN.
+        """
+        type_names = list(self.patterns)
+        scores = np.full((len(columns), len(type_names)), np.nan)
+        if not columns:
+            return scores
+
+        counts = np.array([len(values) for values in columns])
+        offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        stacked = pd.concat(columns, ignore_index=True)
+
+        def column_ratio(mask: pd.Series) -> np.ndarray:
+            return np.add.reduceat(mask.to_numpy(dtype=np.int64), offsets) / counts
+
+        for type_index, (type_name, pattern) in enumerate(self.patterns.items()):
+            try:
+                # Count pattern matches for non-null values
+                type_scores = column_ratio(stacked.str.match(pattern, na=False))
+
+                # Adjust scores based on field characteristics
+                if type_name == "Number":
+                    numeric_ratio = column_ratio(
+                        pd.to_numeric(stacked, errors="coerce").notna()
+                    )
+                    type_scores = type_scores + np.where(numeric_ratio > 0.8, 0.2, 0.0)
+                elif type_name == "Date":
+                    # Date formats are inferred per column, so parse each one separately
+                    for column_index, values in enumerate(columns):
+                        try:
+                            if (
+                                pd.to_datetime(values, errors="coerce").notna().mean()
+                                > 0.8
+                            ):
+                                type_scores[column_index] += 0.2
+                        except Exception:
+                            type_scores[column_index] = np.nan
+                elif type_name == "Checkbox":
+                    is_boolean = stacked.str.lower().isin(
+                        {"true", "false", "1", "0", "yes", "no"}
+                    )
+                    all_boolean = np.minimum.reduceat(
+                        is_boolean.to_numpy(dtype=np.int64), offsets
+                    )
+                    type_scores = type_scores + np.where(all_boolean == 1, 0.3, 0.0)
+                elif type_name == "Text Area":
+                    max_length = np.maximum.reduceat(
+                        stacked.str.len().to_numpy(dtype=np.int64), offsets
+                    )
+                    type_scores = type_scores + np.where(max_length > 255, 0.3, 0.0)
+
+                scores[:, type_index] = type_scores
+            except Exception:
+                continue
+
+        return scores
+
+    def _prepare_field(
+        self, field_name: str, data: pd.Series
+    ) -> Union[FieldAnalysis, Tuple[pd.Series, float, float]]:
+        """Clean a field, returning its final analysis if it needs no scoring"""
         # Handle empty series
         if len(data) == 0:
             return FieldAnalysis(
@@ -96,48 +215,26 @@ class EnhancedSalesforceValidator:
                 validation_pattern=self.patterns["Text"],
             )
 
-        # Test patterns and calculate scores
-        type_scores = []
-        for type_name, pattern in self.patterns.items():
-            try:
-                # Count pattern matches for non-null values
-                matches = non_null_values.str.match(pattern, na=False)
-                match_ratio = matches.mean() if len(matches) > 0 else 0.0
-
-                # Add type-specific scoring adjustments
-                score = match_ratio
-
-                # Adjust scores based on field characteristics
-                if (
-                    type_name == "Number"
-                    and pd.to_numeric(non_null_values, errors="coerce").notna().mean()
-                    > 0.8
-                ):
-                    score += 0.2
-                elif (
-                    type_name == "Date"
-                    and pd.to_datetime(non_null_values, errors="coerce").notna().mean()
-                    > 0.8
-                ):
-                    score += 0.2
-                elif type_name == "Checkbox" and set(
-                    non_null_values.str.lower()
-                ).issubset({"true", "false", "1", "0", "yes", "no"}):
-                    score += 0.3
-                elif type_name == "Text Area" and non_null_values.str.len().max() > 255:
-                    score += 0.3
-
-                type_scores.append((type_name, score))
-            except Exception as e:
-                continue
+        return non_null_values, unique_ratio, null_ratio
 
-        # Select best match
-        if not type_scores:
+    def _build_analysis(
+        self,
+        field_name: str,
+        non_null_values: pd.Series,
+        unique_ratio: float,
+        null_ratio: float,
+        type_scores: np.ndarray,
+    ) -> FieldAnalysis:
+        """Select the best scoring type for a field"""
+        if np.isnan(type_scores).all():
             # Default to Text if no patterns match
             best_type = "Text"
             confidence = 1.0
         else:
-            best_type, confidence = max(type_scores, key=lambda x: x[1])
+            # nanargmax keeps the first type on ties, like max() over the patterns
+            best_index = int(np.nanargmax(type_scores))
+            best_type = list(self.patterns)[best_index]
+            confidence = type_scores[best_index]
 
         return FieldAnalysis(
             field_name=field_name,
@@ -151,33 +248,28 @@ class EnhancedSalesforceValidator:
         )
 
 
+def _default_analysis(field_name: str) -> FieldAnalysis:
+    """Default Text analysis for columns that failed to analyze"""
+    return FieldAnalysis(
+        field_name=field_name,
+        suggested_type="Text",
+        confidence=0.0,
+        pattern="",
+        sample_values=[],
+        unique_ratio=0.0,
+        null_ratio=1.0,
+        validation_pattern=r"^[\s\S]{0,255}$",
+    )
+
+
 def analyze_dataframe(df: pd.DataFrame) -> Dict[str, FieldAnalysis]:
     """Analyze all fields in a dataframe and return their Salesforce data types"""
     validator = EnhancedSalesforceValidator()
-    results = {}
-
-    for column in df.columns:
-        try:
-            results[column] = validator.analyze_field(column, df[column])
-        except Exception as e:
-            print(f"Error analyzing column {column}: {str(e)}")
-            # Provide a default Text analysis for failed columns
-            results[column] = FieldAnalysis(
-                field_name=column,
-                suggested_type="Text",
-                confidence=0.0,
-                pattern="",
-                sample_values=[],
-                unique_ratio=0.0,
-                null_ratio=1.0,
-                validation_pattern=r"^[\s\S]{0,255}$",
-            )
-
-    return results
+    return validator.analyze_fields({column: df[column] for column in df.columns})
 
 
 def generate_field_mapping_report(
-    analysis_results: Dict[str, FieldAnalysis]
+    analysis_results: Dict[str, FieldAnalysis],
 ) -> pd.DataFrame:
     """
     Generate a detailed report of field mappings
@@ -1,8 +1,9 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import List, Tuple
 
 import pandas as pd
+from infer_data_type import FieldAnalysis
 
 
 @dataclass
@@ -14,20 +15,6 @@ class PatternComponent:
     description: str
 
 
-@dataclass
-class FieldAnalysis:
-    """Analysis result for a field."""
-
-    field_name: str
-    suggested_type: str
-    confidence: float
-    pattern: str
-    sample_values: List[str]
-    unique_ratio: float
-    null_ratio: float
-    validation_pattern: Optional[str]
-
-
 class PatternBuilder:
     """Builds regex patterns dynamically."""
 
@@ -2,11 +2,17 @@ import json
 import os
 import sys
 from datetime import datetime
+from typing import Dict
 from uuid import uuid4
 
 import pandas as pd
 from encoding_utils import convert_to_utf8
-from infer_data_type import EnhancedSalesforceValidator, analyze_dataframe
+from infer_data_type import (
+    EnhancedSalesforceValidator,
+    FieldAnalysis,
+    analyze_dataframe,
+)
+from schema_catalog import SchemaCatalog
 
 from utils import create_output_dir, validate_csv
 
@@ -22,36 +28,17 @@ def generate_unique_filename(output_dir, input_csv_path, extension=".json"):
 
 def process_chunk_data(
     chunk: pd.DataFrame, validator: EnhancedSalesforceValidator
-) -> list:
-    """Process a chunk of data and return field type mappings."""
-    fields = []
+) -> Dict[str, FieldAnalysis]:
+    """Process a chunk of data and return its field analysis results."""
     try:
         # Clean column names - remove problematic characters
         chunk.columns = chunk.columns.str.strip().str.replace(r"[^\w\s-]", "_")
 
         # Analyze the dataframe
-        analysis_results = analyze_dataframe(chunk)
-
-        # Process results
-        for column, analysis in analysis_results.items():
-            fields.append(
-                {
-                    "fieldName": column,
-                    "fieldType": analysis.suggested_type,
-                    "confidence": f"{analysis.confidence:.2%}",
-                    "nullRatio": f"{analysis.null_ratio:.2%}",
-                    "uniqueRatio": f"{analysis.unique_ratio:.2%}",
-                    "validationPattern": analysis.validation_pattern,
-                    "sampleValues": (
-                        analysis.sample_values[:3] if analysis.sample_values else []
-                    ),
-                }
-            )
+        return analyze_dataframe(chunk)
     except Exception as e:
         print(f"Error processing chunk: {str(e)}")
-        return []
-
-    return fields
+        return {}
 
 
 def process_csv(input_csv_path, output_dir, chunksize=500):
@@ -77,6 +64,7 @@ def process_csv(input_csv_path, output_dir, chunksize=500):
 
         # Step 4: Initialize validator and output data
         validator = EnhancedSalesforceValidator()
+        catalog = SchemaCatalog()
         output_data = {}
         object_name = os.path.splitext(os.path.basename(input_csv_path))[0].lower()
         output_data[object_name] = {
@@ -96,7 +84,8 @@ def process_csv(input_csv_path, output_dir, chunksize=500):
 
         # First pass to get field mappings
         first_chunk = pd.read_csv(utf8_csv_path, nrows=chunksize, low_memory=False)
-        output_data[object_name]["fields"] = process_chunk_data(first_chunk, validator)
+        catalog.add_object(object_name, process_chunk_data(first_chunk, validator))
+        output_data[object_name]["fields"] = catalog.field_dicts(object_name)
 
         if not output_data[object_name]["fields"]:
             raise Exception("Failed to analyze fields in the first chunk")
@@ -127,6 +116,11 @@ def process_csv(input_csv_path, output_dir, chunksize=500):
             f"Salesforce data types successfully mapped and saved to {output_json_path}"
         )
 
+        # Save the compact binary catalog alongside the JSON output
+        output_catalog_path = os.path.splitext(output_json_path)[0] + ".npz"
+        catalog.save(output_catalog_path)
+        print(f"Schema catalog saved to {output_catalog_path}")
+
         # Print summary
         print("\nProcessing Summary:")
         print(f"Total chunks processed: {chunk_count}")
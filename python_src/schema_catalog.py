@@ -0,0 +1,338 @@
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from infer_data_type import FieldAnalysis
+
+FORMAT_VERSION = 1
+
+
+class _StringColumn:
+    """Variable-length strings packed into one buffer with character offsets"""
+
+    __slots__ = ("_chunks", "_offsets")
+
+    def __init__(self, text: str = "", offsets: Optional[np.ndarray] = None):
+        self._chunks = [text]
+        self._offsets = np.zeros(1, dtype=np.int64) if offsets is None else offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        return self._text[self._offsets[index] : self._offsets[index + 1]]
+
+    @property
+    def _text(self) -> str:
+        # Appended chunks are joined lazily so repeated extends stay linear
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0]
+
+    def slice(self, start: int, stop: int) -> List[str]:
+        text = self._text
+        offsets = self._offsets[start : stop + 1].tolist()
+        return [text[a:b] for a, b in zip(offsets, offsets[1:])]
+
+    def extend(self, values: List[str]) -> None:
+        lengths = np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+        self._offsets = np.concatenate(
+            (self._offsets, self._offsets[-1] + np.cumsum(lengths))
+        )
+        self._chunks.append("".join(values))
+
+    def to_arrays(self, prefix: str) -> Dict[str, np.ndarray]:
+        encoded = self._text.encode("utf-8", "surrogatepass")
+        return {
+            f"{prefix}_text": np.frombuffer(encoded, dtype=np.uint8),
+            f"{prefix}_offsets": self._offsets,
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays, prefix: str) -> "_StringColumn":
+        text = arrays[f"{prefix}_text"].tobytes().decode("utf-8", "surrogatepass")
+        return cls(text, arrays[f"{prefix}_offsets"])
+
+
+class FieldRecord:
+    """Lightweight view of a single field stored in a SchemaCatalog"""
+
+    __slots__ = ("_catalog", "_index")
+
+    def __init__(self, catalog: "SchemaCatalog", index: int):
+        self._catalog = catalog
+        self._index = index
+
+    def __repr__(self) -> str:
+        return (
+            f"FieldRecord(object_name={self.object_name!r}, "
+            f"field_name={self.field_name!r}, suggested_type={self.suggested_type!r}, "
+            f"confidence={self.confidence:.4f})"
+        )
+
+    @property
+    def object_name(self) -> str:
+        return self._catalog._object_names[self._catalog._object_codes[self._index]]
+
+    @property
+    def field_name(self) -> str:
+        return self._catalog._field_names[self._index]
+
+    @property
+    def suggested_type(self) -> str:
+        return self._catalog._type_names[self._catalog._type_codes[self._index]]
+
+    @property
+    def confidence(self) -> float:
+        return float(self._catalog._confidence[self._index])
+
+    @property
+    def unique_ratio(self) -> float:
+        return float(self._catalog._unique_ratio[self._index])
+
+    @property
+    def null_ratio(self) -> float:
+        return float(self._catalog._null_ratio[self._index])
+
+    @property
+    def pattern(self) -> Optional[str]:
+        return self._catalog._pattern(self._catalog._pattern_codes[self._index])
+
+    @property
+    def validation_pattern(self) -> Optional[str]:
+        return self._catalog._pattern(
+            self._catalog._validation_pattern_codes[self._index]
+        )
+
+    @property
+    def sample_values(self) -> List[str]:
+        offsets = self._catalog._sample_offsets
+        return self._catalog._sample_values.slice(
+            offsets[self._index], offsets[self._index + 1]
+        )
+
+    def to_analysis(self) -> FieldAnalysis:
+        """Convert the record back into a FieldAnalysis"""
+        return FieldAnalysis(
+            field_name=self.field_name,
+            suggested_type=self.suggested_type,
+            confidence=self.confidence,
+            pattern=self.pattern,
+            sample_values=self.sample_values,
+            unique_ratio=self.unique_ratio,
+            null_ratio=self.null_ratio,
+            validation_pattern=self.validation_pattern,
+        )
+
+    def to_dict(self) -> dict:
+        """Field entry in the JSON output format"""
+        return {
+            "fieldName": self.field_name,
+            "fieldType": self.suggested_type,
+            "confidence": f"{self.confidence:.2%}",
+            "nullRatio": f"{self.null_ratio:.2%}",
+            "uniqueRatio": f"{self.unique_ratio:.2%}",
+            "validationPattern": self.validation_pattern,
+            "sampleValues": self.sample_values[:3],
+        }
+
+
+class SchemaCatalog:
+    """
+    Columnar store of field analysis results for many Salesforce objects
+
+    Each field attribute is kept in its own array, with object names, type names
+    and patterns interned into small lookup tables. Fields are accessed through
+    FieldRecord views, and the catalog saves to and loads from a numpy .npz file.
+    """
+
+    def __init__(self):
+        self._object_names: List[str] = []
+        self._type_names: List[str] = []
+        self._patterns: List[str] = []
+        self._object_codes = np.empty(0, dtype=np.int32)
+        self._type_codes = np.empty(0, dtype=np.int16)
+        self._pattern_codes = np.empty(0, dtype=np.int32)
+        self._validation_pattern_codes = np.empty(0, dtype=np.int32)
+        self._confidence = np.empty(0, dtype=np.float64)
+        self._unique_ratio = np.empty(0, dtype=np.float64)
+        self._null_ratio = np.empty(0, dtype=np.float64)
+        self._field_names = _StringColumn()
+        self._sample_values = _StringColumn()
+        self._sample_offsets = np.zeros(1, dtype=np.int64)
+        self._lookup: Optional[Dict[Tuple[str, str], int]] = None
+
+    def __len__(self) -> int:
+        return len(self._field_names)
+
+    def __getitem__(self, index: int) -> FieldRecord:
+        if not -len(self) <= index < len(self):
+            raise IndexError("catalog index out of range")
+        return FieldRecord(self, index % len(self))
+
+    def __iter__(self) -> Iterator[FieldRecord]:
+        return (FieldRecord(self, index) for index in range(len(self)))
+
+    @property
+    def objects(self) -> List[str]:
+        return list(self._object_names)
+
+    def add_object(
+        self, object_name: str, analysis_results: Dict[str, FieldAnalysis]
+    ) -> None:
+        """
+        Append the analyzed fields of one object to the catalog
+
+        Args:
+            object_name: Name of the Salesforce object
+            analysis_results: Dictionary of FieldAnalysis results keyed by field name
+        """
+        if object_name in self._object_names:
+            raise ValueError(f"Object {object_name} is already in the catalog")
+
+        object_code = len(self._object_names)
+        self._object_names.append(object_name)
+        analyses = list(analysis_results.values())
+        count = len(analyses)
+
+        def column(values, dtype) -> np.ndarray:
+            return np.fromiter(values, dtype=dtype, count=count)
+
+        new_columns = {
+            "_object_codes": np.full(count, object_code, dtype=np.int32),
+            "_type_codes": column(
+                (self._intern(self._type_names, a.suggested_type) for a in analyses),
+                np.int16,
+            ),
+            "_pattern_codes": column(
+                (self._intern_pattern(a.pattern) for a in analyses), np.int32
+            ),
+            "_validation_pattern_codes": column(
+                (self._intern_pattern(a.validation_pattern) for a in analyses),
+                np.int32,
+            ),
+            "_confidence": column((a.confidence for a in analyses), np.float64),
+            "_unique_ratio": column((a.unique_ratio for a in analyses), np.float64),
+            "_null_ratio": column((a.null_ratio for a in analyses), np.float64),
+        }
+        for name, values in new_columns.items():
+            setattr(self, name, np.concatenate((getattr(self, name), values)))
+        self._field_names.extend([str(name) for name in analysis_results])
+
+        # Sample values are stored as strings, flattened with per-field offsets
+        samples = [[str(value) for value in a.sample_values] for a in analyses]
+        self._sample_values.extend([value for values in samples for value in values])
+        sample_counts = column((len(values) for values in samples), np.int64)
+        self._sample_offsets = np.concatenate(
+            (
+                self._sample_offsets,
+                self._sample_offsets[-1] + np.cumsum(sample_counts),
+            )
+        )
+        self._lookup = None
+
+    def fields(self, object_name: str) -> List[FieldRecord]:
+        """Return the fields of an object in their original column order"""
+        if object_name not in self._object_names:
+            return []
+        object_code = self._object_names.index(object_name)
+        indices = np.flatnonzero(self._object_codes == object_code)
+        return [FieldRecord(self, index) for index in indices.tolist()]
+
+    def fields_of_type(self, type_name: str) -> List[FieldRecord]:
+        """Return every field whose suggested type is type_name"""
+        if type_name not in self._type_names:
+            return []
+        type_code = self._type_names.index(type_name)
+        indices = np.flatnonzero(self._type_codes == type_code)
+        return [FieldRecord(self, index) for index in indices.tolist()]
+
+    def find(self, object_name: str, field_name: str) -> Optional[FieldRecord]:
+        """Look up a single field, or None if it is not in the catalog"""
+        if self._lookup is None:
+            object_names = [self._object_names[c] for c in self._object_codes.tolist()]
+            field_names = self._field_names.slice(0, len(self))
+            self._lookup = {
+                key: index for index, key in enumerate(zip(object_names, field_names))
+            }
+        index = self._lookup.get((object_name, field_name))
+        return None if index is None else FieldRecord(self, index)
+
+    def field_dicts(self, object_name: str) -> List[dict]:
+        """Return an object's fields in the JSON output format"""
+        return [record.to_dict() for record in self.fields(object_name)]
+
+    def to_json(self) -> dict:
+        """Export the catalog as a JSON-compatible dictionary keyed by object name"""
+        return {
+            object_name: {
+                "objectName": object_name,
+                "fields": self.field_dicts(object_name),
+            }
+            for object_name in self._object_names
+        }
+
+    def save(self, path: str) -> None:
+        """Save the catalog to a numpy .npz file"""
+        arrays = {
+            "format_version": np.array(FORMAT_VERSION),
+            "object_codes": self._object_codes,
+            "type_codes": self._type_codes,
+            "pattern_codes": self._pattern_codes,
+            "validation_pattern_codes": self._validation_pattern_codes,
+            "confidence": self._confidence,
+            "unique_ratio": self._unique_ratio,
+            "null_ratio": self._null_ratio,
+            "sample_offsets": self._sample_offsets,
+        }
+        arrays.update(self._field_names.to_arrays("field_names"))
+        arrays.update(self._sample_values.to_arrays("sample_values"))
+        for name, values in (
+            ("object_names", self._object_names),
+            ("type_names", self._type_names),
+            ("patterns", self._patterns),
+        ):
+            table = _StringColumn()
+            table.extend(values)
+            arrays.update(table.to_arrays(name))
+
+        with open(path, "wb") as catalog_file:
+            np.savez(catalog_file, **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> "SchemaCatalog":
+        """Load a catalog saved with SchemaCatalog.save"""
+        with np.load(path) as arrays:
+            version = int(arrays["format_version"])
+            if version != FORMAT_VERSION:
+                raise ValueError(f"Unsupported catalog format version: {version}")
+
+            catalog = cls()
+            catalog._object_codes = arrays["object_codes"]
+            catalog._type_codes = arrays["type_codes"]
+            catalog._pattern_codes = arrays["pattern_codes"]
+            catalog._validation_pattern_codes = arrays["validation_pattern_codes"]
+            catalog._confidence = arrays["confidence"]
+            catalog._unique_ratio = arrays["unique_ratio"]
+            catalog._null_ratio = arrays["null_ratio"]
+            catalog._sample_offsets = arrays["sample_offsets"]
+            catalog._field_names = _StringColumn.from_arrays(arrays, "field_names")
+            catalog._sample_values = _StringColumn.from_arrays(arrays, "sample_values")
+            for name in ("object_names", "type_names", "patterns"):
+                table = _StringColumn.from_arrays(arrays, name)
+                setattr(catalog, f"_{name}", table.slice(0, len(table)))
+
+        return catalog
+
+    def _pattern(self, code: int) -> Optional[str]:
+        return None if code < 0 else self._patterns[code]
+
+    def _intern_pattern(self, pattern: Optional[str]) -> int:
+        return -1 if pattern is None else self._intern(self._patterns, pattern)
+
+    @staticmethod
+    def _intern(table: List[str], value: str) -> int:
+        try:
+            return table.index(value)
+        except ValueError:
+            table.append(value)
+            return len(table) - 1